@@ -1,10 +1,24 @@
+import copy
+import datetime
 import logging
+import threading
 import time
+from urllib.parse import quote
 from ..web import WebAPI
 logger = logging.getLogger(__name__)
 
 
 class GoogleDriveFile:
+    # Caches the metadata of files by (file ID, credential), shared by all instances
+    metadata_cache = dict()
+    # Expiration time for each cached metadata
+    metadata_expire = dict()
+    # Ensures the metadata cache is not modified by multiple threads at the same time
+    metadata_lock = threading.Lock()
+
+    # The number of seconds before the cached metadata expires.
+    CACHE_EXPIRE_SEC = 300
+
     def __init__(self, file_id, access_token=None, api_key=None):
         """Initializes the API for accessing Google Drive file.
 
@@ -24,6 +38,8 @@ class GoogleDriveFile:
         """
         self.file_id = file_id
         self._metadata = None
+        # Metadata is cached for each credential, since the permissions of the credentials may be different.
+        self.__cache_key = (file_id, access_token or None, None if access_token else api_key)
         if access_token:
             self.api = WebAPI("https://www.googleapis.com/")
             self.api.add_header(Authorization="Bearer %s" % access_token)
@@ -38,10 +54,51 @@ class GoogleDriveFile:
         See Also: https://developers.google.com/drive/api/v3/fields-parameter
         """
         if not self._metadata:
-            url = "https://www.googleapis.com/drive/v3/files/%s?fields=*" % self.file_id
-            self._metadata = self.api.get_json(url)
+            self._metadata = self.get_cached_metadata()
         return self._metadata
 
+    def get_cached_metadata(self):
+        """Gets the metadata of the file from the cache shared by all instances using the same credential.
+        The metadata will be requested from the API if it is not cached or the cache is expired.
+
+        Returns: A copy of the cached metadata as a dictionary.
+        """
+        now = datetime.datetime.now()
+        cache_key = self.__cache_key
+        with self.metadata_lock:
+            metadata = self.metadata_cache.get(cache_key)
+            expire = self.metadata_expire.get(cache_key)
+            if metadata and expire and expire > now:
+                return copy.deepcopy(metadata)
+        url = "https://www.googleapis.com/drive/v3/files/%s?fields=*" % self.file_id
+        metadata = self.api.get_json(url)
+        # Error responses are not cached.
+        if metadata and "error" not in metadata:
+            with self.metadata_lock:
+                self.__remove_expired(now)
+                self.metadata_cache[cache_key] = copy.deepcopy(metadata)
+                self.metadata_expire[cache_key] = now + datetime.timedelta(seconds=self.CACHE_EXPIRE_SEC)
+        return metadata
+
+    @classmethod
+    def __remove_expired(cls, now):
+        """Removes the expired metadata from the cache.
+        The cache keys contain the access tokens, which are refreshed regularly.
+        This method must be called with metadata_lock.
+        """
+        expired = [key for key, expire in cls.metadata_expire.items() if expire <= now]
+        for key in expired:
+            cls.metadata_cache.pop(key, None)
+            cls.metadata_expire.pop(key, None)
+
+    @classmethod
+    def clear_cache(cls):
+        """Removes all cached metadata.
+        """
+        with cls.metadata_lock:
+            cls.metadata_cache.clear()
+            cls.metadata_expire.clear()
+
     def get_meta(self, fields):
         """
         See Also: https://developers.google.com/drive/api/v3/fields-parameter
@@ -61,6 +118,11 @@ class GoogleDriveFile:
 class GoogleSheet(GoogleDriveFile):
     """Represents a Google Sheet file
     """
+    def __init__(self, file_id, access_token=None, api_key=None):
+        super().__init__(file_id, access_token=access_token, api_key=api_key)
+        # Caches the titles of the sheets
+        self._sheet_titles = None
+
     @property
     def sheets(self):
         """Gets a list of sheets from the API response (in terms of dictionaries).
@@ -136,7 +198,13 @@ class GoogleSheet(GoogleDriveFile):
 
         Returns: A 2-D list of values. The type of the values depends on the value_type parameter.
 
+        For formattedValue, the values are requested from the values endpoint,
+        which returns only the values instead of the data and format of all cells.
+
         """
+        if value_type == "formattedValue":
+            return self.__get_formatted_values(sheet_index)
+
         sheets = self.get(includeGridData=True).get("sheets")
         if not sheets:
             return None
@@ -146,12 +214,31 @@ class GoogleSheet(GoogleDriveFile):
             return None
 
         rows = data[0].get("rowData", [])
-        grid = []
-        for row in rows:
-            values = row.get("values", [])
-            row_values = [v.get(value_type) for v in values]
-            grid.append(row_values)
-        return grid
+        return [[v.get(value_type) for v in row.get("values", ())] for row in rows]
+
+    @property
+    def sheet_titles(self):
+        """The titles of the sheets as a list.
+        """
+        if self._sheet_titles is None:
+            sheets = self.get(fields="sheets.properties.title").get("sheets")
+            if sheets is None:
+                return None
+            self._sheet_titles = [sheet.get("properties", {}).get("title") for sheet in sheets]
+        return self._sheet_titles
+
+    def __get_formatted_values(self, sheet_index):
+        """Gets the formatted values of a sheet from the values endpoint.
+        Empty cells are returned as None, which is the same as get_data_grid() with cell data.
+        """
+        titles = self.sheet_titles
+        if not titles:
+            return None
+        # Sheet names in A1 notation are quoted with single quotes.
+        # Single quotes in the sheet name are escaped by doubling them.
+        sheet_range = "'%s'" % titles[sheet_index].replace("'", "''")
+        values = self.values(quote(sheet_range, safe="")).get("values", [])
+        return [[v if v != "" else None for v in row] for row in values]
 
     def get_row_data(self, row_number, sheet_name, from_col=None):
         """Gets the data values of a row from a sheet as a list
@@ -25,21 +25,121 @@ class OutputWriter(io.StringIO):
     Although this class accepts any file-like object as listener, only StringIO() is tested.
     This class does not handle the opening and closing of a file.
 
+    Outputs are buffered and written to the listeners in chunks of at least BUFFER_SIZE characters,
+    or when flush() is called.
+    Outputs are written to the stream (if any) immediately without buffering.
+
     """
-    def __init__(self, listeners):
+    # Number of characters to be buffered before writing to the listeners.
+    BUFFER_SIZE = 8192
+
+    def __init__(self, listeners, stream=None):
         """Initialize a writer with a list of file-like objects (listeners).
 
         Args:
             listeners (list): A list of file-like objects.
+            stream: A file-like object to receive the outputs without buffering, e.g. the original sys.stdout.
         """
-        self.listeners = listeners
+        self.listeners = tuple(listeners)
+        # Bound write methods of the listeners
+        self.__write_fns = tuple(listener.write for listener in self.listeners)
+        self.stream = stream
+        self.__buffer = []
+        self.__buffer_size = 0
+        self.__lock = threading.Lock()
         super(OutputWriter, self).__init__()
 
-    def write(self, *args, **kwargs):
-        """Writes the output to the listeners.
+    def __write_buffer(self):
+        """Writes the buffered outputs to the listeners.
+        This method must be called with self.__lock.
+        """
+        if not self.__buffer:
+            return
+        chunk = "".join(self.__buffer)
+        self.__buffer = []
+        self.__buffer_size = 0
+        for write in self.__write_fns:
+            write(chunk)
+
+    def set_listeners(self, listeners):
+        """Replaces the listeners.
+        Outputs buffered before calling this method are written to the previous listeners.
+
+        Args:
+            listeners (list): A list of file-like objects.
+        """
+        listeners = tuple(listeners)
+        write_fns = tuple(listener.write for listener in listeners)
+        with self.__lock:
+            self.__write_buffer()
+            self.listeners = listeners
+            self.__write_fns = write_fns
+
+    def write(self, s):
+        """Writes the output to the stream and the listeners.
+        """
+        if self.stream is not None:
+            self.stream.write(s)
+        with self.__lock:
+            self.__buffer.append(s)
+            self.__buffer_size += len(s)
+            if self.__buffer_size >= self.BUFFER_SIZE:
+                self.__write_buffer()
+        return len(s)
+
+    def flush(self):
+        """Writes the buffered outputs to the listeners and flushes the listeners and the stream.
+        """
+        with self.__lock:
+            self.__write_buffer()
+            for listener in self.listeners:
+                listener.flush()
+        if self.stream is not None:
+            self.stream.flush()
+
+
+class ThreadOutputWriter(io.StringIO):
+    """Represents a writer sending the outputs to the OutputWriter of the current thread.
+
+    Each thread may set its own OutputWriter with the writer property.
+    Outputs from a thread without an OutputWriter are written to the stream only.
+
+    """
+    def __init__(self, stream):
+        """Initialize a writer with the stream receiving the outputs of all threads.
+
+        Args:
+            stream: A file-like object, e.g. the original sys.stdout.
+        """
+        self.stream = stream
+        self.__local = threading.local()
+        super(ThreadOutputWriter, self).__init__()
+
+    @property
+    def writer(self):
+        """The OutputWriter of the current thread, or None if the current thread does not have one.
         """
-        for listener in self.listeners:
-            listener.write(*args, **kwargs)
+        return getattr(self.__local, "writer", None)
+
+    @writer.setter
+    def writer(self, writer):
+        self.__local.writer = writer
+
+    def write(self, s):
+        """Writes the output to the OutputWriter of the current thread, or to the stream if there is none.
+        """
+        writer = getattr(self.__local, "writer", None)
+        if writer is not None:
+            return writer.write(s)
+        self.stream.write(s)
+        return len(s)
+
+    def flush(self):
+        writer = getattr(self.__local, "writer", None)
+        if writer is not None:
+            writer.flush()
+        else:
+            self.stream.flush()
 
 
 class CaptureOutput:
@@ -61,8 +161,6 @@ class CaptureOutput:
             When the last instance of this class exits, the sys.stdout will be reset to CaptureOutput.sys_out.
         sys_err: The system stderr before using any instance of this class.
             When the last instance of this class exits, the sys.stderr will be reset to CaptureOutput.sys_err.
-        out_listeners: A dictionary of file-like objects expecting outputs from stdout.
-        err_listeners: A dictionary of file-like objects expecting outputs from stderr.
 
     Examples:
         with CaptureOutput() as out:
@@ -73,9 +171,10 @@ class CaptureOutput:
         log_messages = out.log_out
 
     Multi-Threading:
-        When using this class, stdout/stderr from all threads in the same process will be captured.
-        To capture the stdout/stderr of a particular thread, run the thread in an independent process.
-        Only the logs of the current thread will be captured.
+        Only the stdout/stderr and the logs of the current thread will be captured.
+        Each thread keeps its own stack of CaptureOutput instances,
+            nested instances in the same thread will all capture the outputs.
+        Outputs from threads not capturing outputs are written to the original stdout/stderr.
 
     Warnings:
         Using this class will set the level of root logger to DEBUG.
@@ -86,10 +185,22 @@ class CaptureOutput:
     sys_out = None
     sys_err = None
 
-    # Must use lock when iterating or adding items to listeners
+    # Must use lock when changing sys.stdout/sys.stderr or accessing the pool.
     listener_lock = threading.Lock()
-    __out_listeners = dict()
-    __err_listeners = dict()
+    # The number of instances capturing outputs in all threads.
+    __active_count = 0
+    # StringIO objects to be reused as listeners. Must use listener_lock when accessing the pool.
+    __io_pool = []
+    # The maximum number of StringIO objects kept in the pool
+    IO_POOL_SIZE = 16
+
+    # The ThreadOutputWriter objects set as sys.stdout and sys.stderr when there are active instances.
+    # The same writers are used until all instances exit.
+    __out_writer = None
+    __err_writer = None
+
+    # Stores the stack of the active instances of the current thread.
+    __local = threading.local()
 
     def __init__(self, suppress_exception=False, log_level=logging.DEBUG, filters=None):
         """Initializes log handler and attributes to store the outputs.
@@ -113,42 +224,77 @@ class CaptureOutput:
         self.exc_out = ""
         self.returns = None
 
+        # StringIO objects receiving the outputs while capturing.
+        self.__out_io = None
+        self.__err_io = None
+
+    @staticmethod
+    def __get_stack():
+        """Gets the stack of active instances of the current thread.
+        """
+        stack = getattr(CaptureOutput.__local, "stack", None)
+        if stack is None:
+            stack = []
+            CaptureOutput.__local.stack = stack
+        return stack
+
     @staticmethod
     def get_listeners(uid):
-        with CaptureOutput.listener_lock:
-            if uid in CaptureOutput.__out_listeners.keys():
-                out_listener = CaptureOutput.__out_listeners[uid]
-                err_listener = CaptureOutput.__out_listeners[uid]
-                return out_listener, err_listener
-            return None, None
+        """Gets the StringIO objects receiving stdout and stderr for an active instance in the current thread.
+
+        Args:
+            uid: The uuid of the CaptureOutput instance.
+
+        Returns: A tuple of (out_listener, err_listener), or (None, None) if the instance is not found.
+        """
+        for capture in CaptureOutput.__get_stack():
+            if capture.uuid == uid:
+                return capture.__out_io, capture.__err_io
+        return None, None
 
     @staticmethod
-    def __config_sys_outputs():
-        """Configures sys.stdout and sys.stderr.
-            If there are listeners, sys.stdout/sys.stderr will be redirect to an instance of OutputWriter,
-            which will write the outputs to all listeners.
-            If there is no listener, sys.stdout/sys.stderr will be restored to the values saved before.
+    def __config_thread_outputs(stack):
+        """Configures the OutputWriter of the current thread for sys.stdout and sys.stderr.
+            If there are active instances in the current thread,
+            the outputs of the thread will be sent to the StringIO objects of all the instances.
+            Otherwise, the OutputWriter of the thread is flushed and removed.
 
-        Remarks:
-            listener_lock is required to run this method to avoid listener dictionaries being modified by other threads.
-            This method is being executed in __enter__() and __exit__() with listener_lock.
+        Args:
+            stack (list): The stack of active instances of the current thread.
 
         """
-        if CaptureOutput.__out_listeners:
-            out_listener_list = [l for l in CaptureOutput.__out_listeners.values()]
-            out_listener_list.append(CaptureOutput.sys_out)
-            sys.stdout = OutputWriter(out_listener_list)
-        else:
-            sys.stdout = CaptureOutput.sys_out
-            CaptureOutput.sys_out = None
+        for thread_writer, listeners in (
+            (CaptureOutput.__out_writer, [capture.__out_io for capture in stack]),
+            (CaptureOutput.__err_writer, [capture.__err_io for capture in stack]),
+        ):
+            writer = thread_writer.writer
+            if listeners:
+                if writer is None:
+                    thread_writer.writer = OutputWriter(listeners, thread_writer.stream)
+                else:
+                    writer.set_listeners(listeners)
+            elif writer is not None:
+                writer.flush()
+                thread_writer.writer = None
 
-        if CaptureOutput.__err_listeners:
-            err_listener_list = [l for l in CaptureOutput.__err_listeners.values()]
-            err_listener_list.append(CaptureOutput.sys_err)
-            sys.stderr = OutputWriter(err_listener_list)
-        else:
-            sys.stderr = CaptureOutput.sys_err
-            CaptureOutput.sys_err = None
+    @staticmethod
+    def __acquire_io():
+        """Gets an empty StringIO from the pool, or creates a new one if the pool is empty.
+        This method must be called with listener_lock.
+        """
+        if CaptureOutput.__io_pool:
+            return CaptureOutput.__io_pool.pop()
+        return io.StringIO()
+
+    @staticmethod
+    def __release_io(string_io):
+        """Empties a StringIO and returns it to the pool.
+        This method must be called with listener_lock.
+        """
+        if len(CaptureOutput.__io_pool) < CaptureOutput.IO_POOL_SIZE:
+            string_io.seek(0)
+            string_io.truncate(0)
+            CaptureOutput.__io_pool.append(string_io)
 
     def __enter__(self):
         """Configures sys.stdout and sys.stderr, and attaches the log handler to root logger.
@@ -156,17 +302,23 @@ class CaptureOutput:
         Returns: A CaptureOutput object (self).
 
         """
-        # Save the sys.stdout and sys.stderr before the first instance of this class start capturing outputs.
-        if CaptureOutput.sys_out is None:
-            CaptureOutput.sys_out = sys.stdout
-        if CaptureOutput.sys_err is None:
-            CaptureOutput.sys_err = sys.stderr
-
-        # Update listeners and re-config output writer.
         with self.listener_lock:
-            CaptureOutput.__out_listeners[self.uuid] = io.StringIO()
-            CaptureOutput.__err_listeners[self.uuid] = io.StringIO()
-            self.__config_sys_outputs()
+            # Save the sys.stdout and sys.stderr before the first instance of this class start capturing outputs.
+            if CaptureOutput.__active_count == 0:
+                CaptureOutput.sys_out = sys.stdout
+                CaptureOutput.sys_err = sys.stderr
+                CaptureOutput.__out_writer = ThreadOutputWriter(CaptureOutput.sys_out)
+                CaptureOutput.__err_writer = ThreadOutputWriter(CaptureOutput.sys_err)
+                sys.stdout = CaptureOutput.__out_writer
+                sys.stderr = CaptureOutput.__err_writer
+            CaptureOutput.__active_count += 1
+            self.__out_io = self.__acquire_io()
+            self.__err_io = self.__acquire_io()
+
+        # Only the current thread is affected, no lock is needed.
+        stack = self.__get_stack()
+        stack.append(self)
+        self.__config_thread_outputs(stack)
 
         # Modify root logger level and add log handler.
         root_logger = logging.getLogger()
@@ -187,14 +339,34 @@ class CaptureOutput:
         # Removes log handler
         root_logger = logging.getLogger()
         root_logger.removeHandler(self.log_handler)
-        self.log_out = "\n".join(self.log_handler.logs)
+        # Log records are formatted only once when exiting.
         self.logs = self.log_handler.logs
+        self.log_out = "\n".join(self.logs)
+        # Release the log records, which may reference large objects in their arguments.
+        self.log_handler.records = []
+
+        # Outputs buffered in the OutputWriter are written to this instance before it is removed from the listeners.
+        stack = self.__get_stack()
+        stack.remove(self)
+        self.__config_thread_outputs(stack)
+        out_io = self.__out_io
+        err_io = self.__err_io
+        self.__out_io = self.__err_io = None
+        self.std_out = out_io.getvalue()
+        self.std_err = err_io.getvalue()
 
-        # Update listeners and re-config output writer.
         with self.listener_lock:
-            self.std_out = CaptureOutput.__out_listeners.pop(self.uuid).getvalue()
-            self.std_err = CaptureOutput.__err_listeners.pop(self.uuid).getvalue()
-            self.__config_sys_outputs()
+            self.__release_io(out_io)
+            self.__release_io(err_io)
+            CaptureOutput.__active_count -= 1
+            # Restore sys.stdout and sys.stderr when the last instance exits.
+            if CaptureOutput.__active_count == 0:
+                sys.stdout = CaptureOutput.sys_out
+                sys.stderr = CaptureOutput.sys_err
+                CaptureOutput.sys_out = None
+                CaptureOutput.sys_err = None
+                CaptureOutput.__out_writer = None
+                CaptureOutput.__err_writer = None
 
         # Exception will be suppressed if returning True
         if self.suppress_exception:
@@ -281,12 +453,31 @@ class StreamHandler(logging.StreamHandler):
             self.setFormatter(MessageFormatter())
 
 
+class ThreadLogFilter(logging.Filter):
+    """Logging filter to keep only the logs of a particular thread.
+    """
+    def __init__(self, thread_id):
+        """Initialize the filter with the ID of the thread.
+
+        Args:
+            thread_id: The ID of the thread.
+        """
+        super().__init__()
+        self.thread_id = thread_id
+
+    def filter(self, record):
+        return record.thread == self.thread_id
+
+
 class ThreadLogHandler(logging.Handler):
     """Captures the logs of a particular thread.
 
     Attributes:
         thread_id: The ID of the thread of which the logs are being captured.
-        logs (list): A list of formatted log messages.
+        records (list): A list of log records.
+            The arguments are merged into the message when the record is saved.
+            Other formatting is done when the logs property is accessed,
+            so that the formatter is not called while the thread is running.
 
     Examples:
         log_handler = ThreadLogHandler(threading.current_thread().ident)
@@ -299,6 +490,9 @@ class ThreadLogHandler(logging.Handler):
         https://github.com/python/cpython/blob/master/Lib/logging/__init__.py
 
     """
+    # The formatter shared by handlers initialized without formatter.
+    default_formatter = MessageFormatter()
+
     def __init__(self, thread_id, formatter=None):
         """Initialize the log handler for a particular thread.
 
@@ -307,29 +501,77 @@ class ThreadLogHandler(logging.Handler):
         """
         super(ThreadLogHandler, self).__init__()
         if formatter is None:
-            formatter = MessageFormatter()
+            formatter = self.default_formatter
         elif isinstance(formatter, str):
             formatter = MessageFormatter(formatter)
         self.setFormatter(formatter)
         self.thread_id = thread_id
-        self.logs = []
-
-    def handle(self, record):
-        """Determine whether to emit base on the thread ID.
-        """
-        if record.thread == self.thread_id:
-            return super().handle(record)
-        return False
+        self.records = []
+        # The thread filter is the first filter, records from other threads will not reach other filters.
+        self.addFilter(ThreadLogFilter(thread_id))
 
     def emit(self, record):
-        """Formats and saves the log message.
+        """Saves a copy of the log record.
+        The arguments are merged into the message of the copy when the record is saved,
+        so that the message shows the values at the time of logging, even if the objects are modified later.
+        The original record is not modified, other handlers will receive the original message and arguments.
         """
         try:
-            message = self.format(record)
-            self.logs.append(message)
+            # Handlers capturing the same thread share the same copy,
+            # so that the formatted message cached in the copy can be reused.
+            prepared = record.__dict__.get("_thread_log_record")
+            if prepared is None:
+                prepared = self.prepare(record)
+                record._thread_log_record = prepared
+            self.records.append(prepared)
         except Exception:
             self.handleError(record)
 
+    @staticmethod
+    def prepare(record):
+        """Makes a copy of the log record with the arguments merged into the message.
+        This is similar to QueueHandler.prepare().
+
+        Returns: A LogRecord.
+        """
+        prepared = copy.copy(record)
+        message = record.msg
+        if isinstance(message, (dict, list)) and not record.args:
+            # Keep a copy of dict and list messages, which will be pretty printed by MessageFormatter.
+            try:
+                prepared.msg = copy.deepcopy(message)
+            except Exception:
+                prepared.msg = pprint.pformat(message)
+        elif not isinstance(message, bytes):
+            prepared.msg = record.getMessage()
+            prepared.args = None
+        return prepared
+
+    def format(self, record):
+        """Formats the log record.
+        The formatted message is cached in the record,
+        so that handlers capturing the same thread with the same formatter will format the record only once.
+        """
+        formatter = self.formatter
+        cached = record.__dict__.get("_thread_log_message")
+        if cached is not None and cached[0] is formatter:
+            return cached[1]
+        message = super().format(record)
+        record._thread_log_message = (formatter, message)
+        return message
+
+    @property
+    def logs(self):
+        """A list of formatted log messages.
+        """
+        messages = []
+        for record in self.records:
+            try:
+                messages.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+        return messages
+
 
 class PackageLogFilter(logging.Filter):
     """Logging filter to keep logs generated from packages within a certain location
@@ -5,9 +5,12 @@ This build script must be executed outside of the Aries directory.
 See Also: https://packaging.python.org/tutorials/packaging-projects/
 """
 import os
+from functools import lru_cache
+from pathlib import Path
 from ..files import Markdown
 
 
+@lru_cache(maxsize=None)
 def get_version():
     # Determine the package version base on the last release tag and total number of first parent commits on master
     release_version = str(os.popen('cd Aries && git tag | tail -1').read()).strip()
@@ -23,19 +26,23 @@ def get_version():
         return release_version
 
 
+@lru_cache(maxsize=None)
 def get_description(readme):
-    with open(readme, "r") as f:
-        long_description = f.read()
-        long_description = Markdown.from_text(
-            long_description
-        ).make_links_absolute("https://github.com/labdave/Aries/blob/master/")
-        return long_description
+    long_description = Path(readme).read_text()
+    return Markdown.from_text(
+        long_description
+    ).make_links_absolute("https://github.com/labdave/Aries/blob/master/")
+
+
+@lru_cache(maxsize=None)
+def read_requirements(req_path):
+    """Reads the requirements file as a tuple of non-empty lines.
+    """
+    return tuple(r.strip() for r in Path(req_path).read_text().splitlines() if r.strip())
 
 
 def get_requirements(req_path, req_aries=False):
-    with open(req_path, "r") as f:
-        requirements = f.read().split("\n")
-        requirements = [r.strip() for r in requirements if r.strip()]
-        if req_aries:
-            requirements.insert(0, "Aries-core==%s" % get_version())
-        return requirements
+    requirements = list(read_requirements(req_path))
+    if req_aries:
+        requirements.insert(0, "Aries-core==%s" % get_version())
+    return requirements
@@ -3,12 +3,76 @@
 import os
 import logging
 from abc import ABC
+from functools import lru_cache
+from itertools import permutations
+from operator import attrgetter
 from tempfile import NamedTemporaryFile
 from urllib.parse import urlparse
 from io import RawIOBase, UnsupportedOperation, SEEK_SET, DEFAULT_BUFFER_SIZE
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def parse_uri(uri):
+    """Parses a URI with urlparse() and caches the result.
+    ParseResult is an immutable named tuple, so the same result can be shared by all storage objects.
+    """
+    return urlparse(uri)
+
+
+# Characters allowed in a file mode.
+MODE_CHARS = frozenset('xrwab+')
+
+
+def get_mode_flags(mode):
+    """Determines the (created, readable, writable, appending) flags of a file mode.
+
+    See Also: https://docs.python.org/3/library/functions.html#open
+
+    """
+    # The following code is modified based on the __init__() of python FileIO class
+    if not MODE_CHARS.issuperset(mode):
+        raise ValueError('Invalid mode: %s' % (mode,))
+    if mode.count('r') + mode.count('w') + mode.count('a') + mode.count('x') != 1 or mode.count('+') > 1:
+        raise ValueError('Must have exactly one of create/read/write/append '
+                         'mode and at most one plus')
+    created = readable = writable = appending = False
+    if 'x' in mode:
+        created = True
+        writable = True
+    elif 'r' in mode:
+        readable = True
+    elif 'w' in mode:
+        writable = True
+    elif 'a' in mode:
+        writable = True
+        appending = True
+    if '+' in mode:
+        readable = True
+        writable = True
+    return created, readable, writable, appending
+
+
+# Maps each valid mode string to its (created, readable, writable, appending) flags.
+# Modes are opened frequently, a dictionary lookup avoids validating the same mode again and again.
+MODE_FLAGS = {
+    "".join(chars): get_mode_flags(base)
+    for base in ("x", "r", "w", "a", "x+", "r+", "w+", "a+")
+    for binary in ("", "b")
+    for chars in permutations(base + binary)
+}
+
+
+def get_mode_key(mode):
+    """Computes an integer key for a file mode, in which each character of the mode sets a bit.
+    Modes with the same characters in any order have the same key, e.g. "rb+" and "r+b".
+    """
+    key = 0
+    for c in mode:
+        key |= 1 << ord(c)
+    return key
+
+
 class StorageObject:
     """Represents a storage object.
     This is the base class for storage folder and storage file.
@@ -31,7 +95,7 @@ class StorageObject:
         See https://en.wikipedia.org/wiki/Uniform_Resource_Identifier
         """
         self.uri = str(uri)
-        parse_result = urlparse(self.uri)
+        parse_result = parse_uri(self.uri)
         self.scheme = parse_result.scheme
         self.hostname = parse_result.hostname
         self.path = parse_result.path
@@ -51,6 +115,10 @@ class StorageObject:
         else:
             self.prefix = self.path
 
+        # The basename and the suffix for temp files are determined when they are accessed for the first time.
+        self._basename = None
+        self._suffix = None
+
     def __str__(self):
         """Returns the URI
         """
@@ -66,7 +134,9 @@ class StorageObject:
         Returns:
             str: The basename of the file/folder
         """
-        return os.path.basename(self.path.strip("/"))
+        if self._basename is None:
+            self._basename = os.path.basename(self.path.strip("/"))
+        return self._basename
 
     @property
     def name(self):
@@ -84,7 +154,9 @@ class StorageObject:
 
         Args:
             storage_objects (list): A list of Storage Objects, from which the values of an attribute will be extracted.
-            attribute (str): A attribute of the storage object.
+            attribute (str or tuple): A attribute of the storage object.
+                If attribute is a tuple of attribute names, each value in the list will be a tuple of values.
+                If attribute is empty, the URIs (which are also the string representations) will be returned.
 
         Returns (list): A list of attribute values.
 
@@ -92,23 +164,94 @@ class StorageObject:
         if not storage_objects:
             return []
         elif not attribute:
-            return [str(f) for f in storage_objects]
+            return list(map(attrgetter("uri"), storage_objects))
+        elif isinstance(attribute, tuple):
+            return list(map(attrgetter(*attribute), storage_objects))
         else:
-            return [getattr(f, attribute) for f in storage_objects]
+            return list(map(attrgetter(attribute), storage_objects))
 
     @staticmethod
-    def copy_stream(from_file_obj, to_file_obj):
-        """Copies data from one file object to another
+    def copy_stream(from_file_obj, to_file_obj, chunk_size=None):
+        """Copies data from one file object to another.
+        This method does not call flush() on to_file_obj.
+
+        Args:
+            from_file_obj: The file object to read from.
+            to_file_obj: The file object to write to.
+            chunk_size (int): The number of bytes to read and write in each iteration.
+                Defaults to StorageObject.BUFFER_SIZE.
+
+        Returns (int): The number of bytes copied.
+
+        """
+        if not chunk_size:
+            chunk_size = StorageObject.BUFFER_SIZE
+        file_size = 0
+        if not hasattr(from_file_obj, "readinto"):
+            while True:
+                b = from_file_obj.read(chunk_size)
+                if not b:
+                    break
+                file_size += to_file_obj.write(b)
+            return file_size
+        # Reuse the same buffer for all chunks, like shutil.copyfileobj() does for files.
+        buffer = bytearray(chunk_size)
+        readinto = from_file_obj.readinto
+        write = to_file_obj.write
+        with memoryview(buffer) as view:
+            n = readinto(buffer)
+            while n:
+                write(view[:n])
+                file_size += n
+                n = readinto(buffer)
+        return file_size
+
+    def _temp_suffix(self):
+        """Returns the file extension to be used as the suffix of a temp file.
+        Everything after the first dot in the basename is considered as extension.
+        """
+        if self._suffix is None:
+            basename = self.basename
+            dot = basename.find(".")
+            self._suffix = basename[dot:] if dot >= 0 else ""
+        return self._suffix
+
+    @staticmethod
+    def send_file(from_file_obj, to_file_obj):
+        """Copies data from one file object to another using os.sendfile(),
+        which transfers the data in the kernel without copying it into python.
+        Data is copied from the current position of from_file_obj to the end of the file.
+
+        Args:
+            from_file_obj: The file object to read from, which must be backed by a regular file.
+            to_file_obj: The file object to write into.
+
+        Returns: The number of bytes copied,
+            or None if the data cannot be copied with sendfile and nothing is copied.
+
         """
-        # TODO: there could be a problem if the file_obj has a different buffer size.
-        chunk_size = StorageObject.BUFFER_SIZE
+        if not hasattr(os, "sendfile"):
+            return None
+        try:
+            from_fd = from_file_obj.fileno()
+            to_fd = to_file_obj.fileno()
+            offset = from_file_obj.tell()
+        except (AttributeError, OSError, ValueError):
+            return None
         file_size = 0
         while True:
-            b = from_file_obj.read(chunk_size)
-            if not b:
+            try:
+                sent = os.sendfile(to_fd, from_fd, offset + file_size, 1 << 30)
+            except OSError:
+                # sendfile does not support the file types, e.g. pipes as input.
+                if not file_size:
+                    return None
+                raise
+            if not sent:
                 break
-            file_size += to_file_obj.write(b)
-        to_file_obj.flush()
+            file_size += sent
+        # sendfile with an offset does not move the position of from_file_obj
+        from_file_obj.seek(offset + file_size)
         return file_size
 
     def create_temp_file(self, delete=False, **kwargs):
@@ -116,11 +259,7 @@ class StorageObject:
         Everything after the first dot is considered as extension
         """
         # Determine the file extension
-        if "suffix" not in kwargs:
-            arr = self.basename.split(".", 1)
-            if len(arr) > 1:
-                suffix = ".%s" % arr[1]
-                kwargs["suffix"] = suffix
+        kwargs.setdefault("suffix", self._temp_suffix())
 
         temp_obj = NamedTemporaryFile('w+b', delete=delete, **kwargs)
         logger.debug("Created temp file: %s" % temp_obj.name)
@@ -272,6 +411,9 @@ class StorageIOBase(StorageObject, RawIOBase):
 
     StorageIOBase and its sub-classes are intended to be the underlying raw IO of StorageFile.
     In general, they should not be used directly. The StorageFile class should be used instead.
+    Each read() or write() on the raw IO may be a system call or a network request.
+    StorageFile wraps the raw IO with a BufferedReader/BufferedWriter/BufferedRandom of BUFFER_SIZE bytes,
+    so that small reads and writes are combined into large ones.
 
     The file is NOT opened when initializing StorageIOBase with __init__().
     To open the file, call open() or use StorageIOBase.init().
@@ -292,6 +434,7 @@ class StorageIOBase(StorageObject, RawIOBase):
         # The following can be set by calling __set_mode(mode)
         # Raw IO always operates in binary mode
         self._mode = None
+        self._mode_key = 0
         self._created = False
         self._readable = False
         self._writable = False
@@ -321,32 +464,21 @@ class StorageIOBase(StorageObject, RawIOBase):
 
         """
         self._mode = mode
-        # The following code is modified based on the __init__() of python FileIO class
-        if not set(mode) <= set('xrwab+'):
-            raise ValueError('Invalid mode: %s' % (mode,))
-        if sum(c in 'rwax' for c in mode) != 1 or mode.count('+') > 1:
-            raise ValueError('Must have exactly one of create/read/write/append '
-                             'mode and at most one plus')
-
-        if 'x' in mode:
-            self._created = True
-            self._writable = True
-        elif 'r' in mode:
-            self._readable = True
-        elif 'w' in mode:
-            self._writable = True
-        elif 'a' in mode:
-            self._writable = True
-            self._appending = True
-        if '+' in mode:
-            self._readable = True
-            self._writable = True
+        self._mode_key = get_mode_key(mode)
+        # The mode may be a list of characters
+        if not isinstance(mode, str):
+            mode = "".join(mode)
+        flags = MODE_FLAGS.get(mode)
+        if flags is None:
+            # Raises ValueError if the mode is invalid
+            flags = get_mode_flags(mode)
+        self._created, self._readable, self._writable, self._appending = flags
 
     def _is_same_mode(self, mode):
         if not self.mode:
             return False
         if mode:
-            return sorted(self.mode) == sorted(mode)
+            return self._mode_key == get_mode_key(mode)
         return True
 
     def open(self, mode='r', *args, **kwargs):
@@ -467,9 +599,11 @@ class StorageIOBase(StorageObject, RawIOBase):
         """
         if self.closed:
             with self.open("wb") as f:
-                file_size = self.copy_stream(stream, f)
-        else:
-            file_size = self.copy_stream(stream, self)
+                return f.load_from(stream)
+        # Copy the data in the kernel if both the stream and this file are backed by file descriptors.
+        file_size = self.send_file(stream, self)
+        if file_size is None:
+            file_size = self.copy_stream(stream, self, self.BUFFER_SIZE)
         return file_size
 
     def download(self, to_file_obj):
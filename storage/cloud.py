@@ -2,11 +2,16 @@ import os
 import datetime
 import logging
 import threading
-from io import FileIO
+from io import FileIO, UnsupportedOperation
+from tempfile import mkstemp
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
 from .base import StorageObject, StoragePrefixBase, StorageIOSeekable
 logger = logging.getLogger(__name__)
 
+# Thread pool shared by all cloud files for reading byte ranges concurrently.
+range_reader_pool = ThreadPoolExecutor(max_workers=8)
+
 
 class BucketStorageObject(StorageObject):
     """Represents a cloud storage object associated with a bucket.
@@ -104,6 +109,18 @@ class CloudStoragePrefix(StoragePrefixBase, ABC):
 
 
 class CloudStorageIO(StorageIOSeekable):
+    """Base class for files on cloud storage.
+
+    Data is read from the cloud with range requests.
+    For write-only modes ("w" and "x" without "+"), data is streamed to the cloud
+        if the sub-class implements open_writer().
+    Otherwise, the file is written into a local temp file, which is uploaded when the file is closed.
+    """
+    # The size of each part when streaming data to or from the cloud storage.
+    PART_SIZE = 8 * 1024 * 1024
+    # Reads larger than this number of bytes will be split into parts and requested concurrently.
+    PARALLEL_READ_THRESHOLD = 16 * 1024 * 1024
+
     def __init__(self, uri):
         """
         """
@@ -115,22 +132,50 @@ class CloudStorageIO(StorageIOSeekable):
         # Stores the temp local FileIO object
         self.__file_io = None
 
-        # Cache the size information
-        # TODO: use cached property
-        self.__size = None
+        # Stores the writer streaming data to the cloud storage
+        self.__writer = None
+
+        # Cache the (exists, size) of the file on the cloud storage
+        self._metadata = None
 
     @property
     def size(self):
-        if not self.__size:
-            if self.__file_io:
-                return os.fstat(self.__file_io.fileno).st_size
-            self.__size = self.get_size()
-        return self.__size
+        if self.__file_io:
+            return os.fstat(self.__file_io.fileno()).st_size
+        return self.get_metadata()[1]
+
+    def get_metadata(self):
+        """Gets the cached metadata of the file on the cloud storage.
+        The metadata will be fetched again after the file is opened, written or closed.
+
+        Returns: A tuple of (exists, size).
+        """
+        if self._metadata is None:
+            self._metadata = self._fetch_metadata()
+        return self._metadata
+
+    def _fetch_metadata(self):
+        """Fetches the metadata of the file from the cloud storage.
+        Sub-class may override this method to get the metadata with a single request.
+
+        Returns: A tuple of (exists, size). The size is None if the file does not exist.
+        """
+        if not self.exists():
+            return False, None
+        return True, self.get_size()
 
     def seek(self, pos, whence=0):
-        if self.__file_io:
-            self._offset = self.__file_io.seek(pos, whence)
-            return self._offset
+        if self.__writer is not None:
+            # Data streamed to the cloud cannot be re-written.
+            offset = self._offset
+            if (whence == 1 and pos == 0) or (whence == 0 and pos == offset):
+                return offset
+            raise UnsupportedOperation("Seek is not supported when writing to %s" % self.uri)
+        file_io = self.__file_io
+        if file_io:
+            offset = file_io.seek(pos, whence)
+            self._offset = offset
+            return offset
         return self._seek(pos, whence)
 
     def tell(self):
@@ -141,16 +186,24 @@ class CloudStorageIO(StorageIOSeekable):
     def local(self):
         """Creates a local copy of the file.
         """
+        # Data is being streamed to the cloud storage.
+        if self.__writer is not None:
+            return self
         if not self.__file_io:
-            file_obj = self.create_temp_file()
+            fd, temp_path = mkstemp(suffix=self._temp_suffix())
+            logger.debug("Created temp file: %s" % temp_path)
             # Download file if appending or updating
-            if self.exists() and ('a' in self.mode or '+' in self.mode):
-                self.download(file_obj)
-            # Close the temp file and open it with FileIO
-            file_obj.close()
+            if self.get_metadata()[0] and ('a' in self.mode or '+' in self.mode):
+                with open(temp_path, 'wb') as file_obj:
+                    self.download(file_obj)
             mode = "".join([c for c in self.mode if c in "rw+ax"])
-            self.__file_io = FileIO(file_obj.name, mode)
-            self.temp_path = file_obj.name
+            if 'a' in mode:
+                # Re-open the file by path so that O_APPEND is set and writes always go to the end of the file.
+                os.close(fd)
+                self.__file_io = FileIO(temp_path, mode)
+            else:
+                self.__file_io = FileIO(fd, mode, closefd=True)
+            self.temp_path = temp_path
         return self
 
     def read(self, size=None):
@@ -158,29 +211,56 @@ class CloudStorageIO(StorageIOSeekable):
 
         Returns: Bytes containing the contents of the file.
         """
-        start = self.tell()
-        if self.__file_io:
-            self.__file_io.seek(start)
-            b = self.__file_io.read(size)
+        file_io = self.__file_io
+        if file_io:
+            start = file_io.tell()
+            b = file_io.read(size)
         else:
-            if not self.exists():
+            start = self._offset
+            exists, file_size = self.get_metadata()
+            if not exists:
                 raise FileNotFoundError("File %s does not exists." % self.uri)
-            file_size = self.size
             # TODO: size unknown?
-            if not file_size:
-                return b""
-            if start >= file_size:
+            if not file_size or start >= file_size:
                 return b""
             end = file_size - 1
-            if size:
+            if size and start + size - 1 < end:
                 end = start + size - 1
-            if end > file_size - 1:
-                end = file_size - 1
             # logger.debug("Reading from %s to %s" % (start, end))
-            b = self.read_bytes(start, end)
-        self._offset += len(b)
+            if end - start + 1 > self.PARALLEL_READ_THRESHOLD:
+                b = self.read_parts(start, end)
+            else:
+                b = self.read_bytes(start, end)
+        self._offset = start + len(b)
         return b
 
+    def read_parts(self, start, end):
+        """Reads bytes from position start to position end, inclusive,
+        by requesting ranges of PART_SIZE bytes concurrently.
+        Each part is copied into a pre-allocated buffer by the thread receiving it,
+        so that the parts are not kept in memory together with the joined data.
+
+        Returns: A bytearray containing the data in the order of the ranges.
+        """
+        part_size = self.PART_SIZE
+        data = bytearray(end - start + 1)
+
+        def read_part(view, part_start, part_end):
+            # The size of the view does not match the part if the file is changed while reading.
+            with view:
+                view[:] = self.read_bytes(part_start, part_end)
+
+        with memoryview(data) as buffer:
+            futures = [
+                range_reader_pool.submit(
+                    read_part, buffer[i - start:min(i + part_size, end + 1) - start], i, min(i + part_size - 1, end)
+                )
+                for i in range(start, end + 1, part_size)
+            ]
+            for future in futures:
+                future.result()
+        return data
+
     def write(self, b):
         """Writes data into the file.
 
@@ -192,18 +272,34 @@ class CloudStorageIO(StorageIOSeekable):
         """
         if self.closed:
             raise ValueError("write to closed file %s" % self.uri)
+        # The size on the cloud storage will be changed.
+        self._metadata = None
+        writer = self.__writer
+        if writer is not None:
+            size = writer.write(b)
+            self._offset += size
+            return size
+        offset = self.tell()
         # Create a temp local file
         self.local()
+        file_io = self.__file_io
         # Write data from buffer to file
-        self.__file_io.seek(self.tell())
-        size = self.__file_io.write(b)
-        self._offset += size
+        file_io.seek(offset)
+        size = file_io.write(b)
+        if 'a' in self.mode:
+            # Data is always appended to the end of the file in appending mode.
+            self._offset = file_io.tell()
+        else:
+            self._offset = offset + size
         return size
 
     def __rm_temp(self):
-        if self.temp_path and os.path.exists(self.temp_path):
-            os.unlink(self.temp_path)
-        logger.debug("Deleted temp file %s of %s" % (self.temp_path, self.uri))
+        if self.temp_path:
+            try:
+                os.unlink(self.temp_path)
+                logger.debug("Deleted temp file %s of %s" % (self.temp_path, self.uri))
+            except FileNotFoundError:
+                pass
         self.temp_path = None
         return
 
@@ -214,11 +310,19 @@ class CloudStorageIO(StorageIOSeekable):
             self.close()
         super().open(mode)
         self._closed = False
+        self._metadata = None
         # Reset offset position when open
         self.seek(0)
         if 'a' in self.mode:
             # Move to the end of the file if open in appending mode.
             self.seek(0, 2)
+        elif self._writable and not self._readable:
+            # Stream the data to the cloud storage if possible.
+            try:
+                self.__writer = self.open_writer()
+            except UnsupportedOperation:
+                if 'w' in self.mode:
+                    self.local()
         elif 'w' in self.mode:
             # Create empty local file
             self.local()
@@ -231,6 +335,14 @@ class CloudStorageIO(StorageIOSeekable):
 
         if self._closed:
             return
+        self._metadata = None
+
+        if self.__writer is not None:
+            logger.debug("Finishing upload to %s" % self.uri)
+            writer = self.__writer
+            self.__writer = None
+            writer.close()
+            self._closed = True
 
         if self.__file_io:
             if not self.__file_io.closed:
@@ -239,7 +351,7 @@ class CloudStorageIO(StorageIOSeekable):
 
         if self.temp_path:
             logger.debug("Uploading file to %s" % self.uri)
-            with open(self.temp_path, 'rb') as f:
+            with open(self.temp_path, 'rb', buffering=self.BUFFER_SIZE) as f:
                 self.upload(f)
             # Remove __temp_file if it exists.
             self.__rm_temp()
@@ -262,6 +374,16 @@ class CloudStorageIO(StorageIOSeekable):
     def upload(self, from_file_obj):
         raise NotImplementedError()
 
+    def open_writer(self):
+        """Opens a writer for streaming data to the cloud storage.
+        The writer must implement write() and close().
+        The data must be uploaded (committed) when close() is called.
+
+        Raises UnsupportedOperation if streaming upload is not supported,
+            in which case the data will be written into a local temp file and uploaded by upload().
+        """
+        raise UnsupportedOperation()
+
     def download(self, to_file_obj):
         """Downloads the data to a file object
         Caution: This method does not call flush()
@@ -27,7 +27,7 @@ class LocalFolder(StorageFolderBase):
 
     def create(self):
         if not os.path.exists(self.path):
-            os.makedirs(self.path)
+            os.makedirs(self.path, exist_ok=True)
         return self
 
     def copy(self, to, contents_only=False):
@@ -48,7 +48,7 @@ class LocalFolder(StorageFolderBase):
         # Create the folder if it does not exist
         if not os.path.exists(local_path):
             logger.debug("Creating new folder: %s" % local_path)
-            os.makedirs(local_path)
+            os.makedirs(local_path, exist_ok=True)
         for file_path in self.file_paths:
             logger.debug("Copying %s" % file_path)
             # Copy the file into the directory
@@ -132,8 +132,14 @@ class LocalFile(StorageIOSeekable):
 
     def copy(self, to):
         """Copies the file to another location.
+        The folder of the destination will be created if it does not exist.
         """
-        shutil.copyfile(self.path, LocalFile(to).path)
+        dest_path = LocalFile(to).path
+        dir_name = os.path.dirname(dest_path)
+        if dir_name and not os.path.exists(dir_name):
+            # Files may be copied into the same new folder in multiple threads.
+            os.makedirs(dir_name, exist_ok=True)
+        shutil.copyfile(self.path, dest_path)
 
     def open(self, mode='r', closefd=True, opener=None):
         """
@@ -147,7 +153,7 @@ class LocalFile(StorageIOSeekable):
             # Create folder structure if one does not exists
             dir_name = os.path.dirname(self.path)
             if not os.path.exists(dir_name):
-                os.makedirs(dir_name)
+                os.makedirs(dir_name, exist_ok=True)
             self.file_io = FileIO(self.path, mode, closefd=closefd, opener=opener)
         return self
 
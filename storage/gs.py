@@ -24,7 +24,7 @@ import base64
 import binascii
 from functools import wraps
 from google.cloud import storage
-from google.cloud.exceptions import ServerError, Forbidden
+from google.cloud.exceptions import ServerError, Forbidden, NotFound
 from ..strings import Base64String
 from ..tasks import FunctionTask
 from .base import StorageFolderBase
@@ -109,20 +109,30 @@ class GSObject(BucketStorageObject):
 
         """
         if self._blob is None:
-            # logger.debug("Getting blob: %s" % self.uri)
-            # The following line will avoid sending a GET request
-            # but bucket object will not have the real metadata
-            bucket = self.client.bucket(self.bucket_name)
-            file_blob = api_call(bucket.get_blob, self.prefix)
-            if file_blob is None:
-                # The following will not make an HTTP request.
-                # It simply instantiates a blob object owned by this bucket.
-                # See https://googleapis.github.io/google-cloud-python/latest/storage/buckets.html
-                # #google.cloud.storage.bucket.Bucket.blob
-                file_blob = self.bucket.blob(self.prefix)
-            self._blob = file_blob
+            self._load_blob()
         return self._blob
 
+    def _load_blob(self):
+        """Gets the blob with a single GET request and caches it as self._blob.
+        If the blob does not exist, a blob object without metadata is cached instead.
+
+        Returns: The blob with metadata, or None if the blob does not exist.
+        """
+        # logger.debug("Getting blob: %s" % self.uri)
+        # The following line will avoid sending a GET request
+        # but bucket object will not have the real metadata
+        bucket = self.client.bucket(self.bucket_name)
+        file_blob = api_call(bucket.get_blob, self.prefix)
+        if file_blob is None:
+            # The following will not make an HTTP request.
+            # It simply instantiates a blob object owned by this bucket.
+            # See https://googleapis.github.io/google-cloud-python/latest/storage/buckets.html
+            # #google.cloud.storage.bucket.Bucket.blob
+            self._blob = self.bucket.blob(self.prefix)
+        else:
+            self._blob = file_blob
+        return file_blob
+
     @api_decorator
     def init_client(self):
         return storage.Client()
@@ -481,6 +491,22 @@ class GSFile(GSObject, CloudStorageIO):
     def get_size(self):
         return self.blob.size
 
+    def _fetch_metadata(self):
+        """Gets the existence and size of the blob with a single request.
+        The blob is loaded with get_blob() on first access, or reloaded if it was loaded before.
+        """
+        if self._blob is None:
+            blob = self._load_blob()
+            if blob is None:
+                return False, None
+            return True, blob.size
+        blob = self._blob
+        try:
+            api_call(blob.reload)
+        except NotFound:
+            return False, None
+        return True, blob.size
+
     def read_bytes(self, start, end):
         return api_call(self.blob.download_as_bytes, start=start, end=end)
 
@@ -490,3 +516,8 @@ class GSFile(GSObject, CloudStorageIO):
 
     def upload(self, from_file_obj):
         api_call(self.blob.upload_from_file, from_file_obj)
+
+    def open_writer(self):
+        """Opens a BlobWriter streaming data to the blob with resumable upload.
+        """
+        return api_call(self.blob.open, "wb", chunk_size=self.PART_SIZE)
@@ -6,14 +6,44 @@ import logging
 import binascii
 import inspect
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from google.cloud import storage
 from io import SEEK_SET, UnsupportedOperation
 from io import BufferedIOBase, BufferedRandom, BufferedReader, BufferedWriter, TextIOWrapper, BytesIO
-from .base import StorageObject, StorageFolderBase
+from .base import StorageObject, StorageFolderBase, get_mode_key
 from .cloud import CloudStorageIO
 from . import gs, file, web, s3
 logger = logging.getLogger(__name__)
 
+# The maximum number of files to be copied concurrently.
+MAX_COPY_WORKERS = 16
+
+
+def copy_files(storage_files, destinations):
+    """Copies files concurrently using a pool of threads.
+    Copying files one by one is limited by the latency of each request to the cloud storage.
+
+    Args:
+        storage_files (list): A list of StorageFile objects to be copied.
+        destinations (list): A list of destination URIs, one for each file in storage_files.
+
+    Returns: None
+
+    Exceptions raised when copying a file will be re-raised after all copies are finished.
+    """
+    storage_files = list(storage_files)
+    if len(storage_files) < 2:
+        for storage_file, to in zip(storage_files, destinations):
+            storage_file.copy(to)
+        return
+    with ThreadPoolExecutor(max_workers=min(MAX_COPY_WORKERS, len(storage_files))) as executor:
+        futures = [
+            executor.submit(storage_file.copy, to)
+            for storage_file, to in zip(storage_files, destinations)
+        ]
+    for future in futures:
+        future.result()
+
 
 class StoragePrefix(StorageObject):
     """Represents a collections of object with the same URI prefix
@@ -97,8 +127,8 @@ class StoragePrefix(StorageObject):
             except (AttributeError, UnsupportedOperation):
                 pass
 
-        for storage_file in self.objects:
-            storage_file.copy(storage_file.uri.replace(self.uri, to))
+        storage_files = self.objects
+        copy_files(storage_files, [f.uri.replace(self.uri, to) for f in storage_files])
 
 
 class StorageFolder(StorageFolderBase):
@@ -249,8 +279,8 @@ class StorageFolder(StorageFolderBase):
         if not contents_only:
             to = os.path.join(to, self.name)
         # logger.debug(self.file_paths)
-        for storage_file in self.files:
-            storage_file.copy(os.path.join(to, storage_file.basename))
+        storage_files = self.files
+        copy_files(storage_files, [os.path.join(to, f.basename) for f in storage_files])
         # logger.debug(self.folder_paths)
         # Recursively copy the sub-folders.
         for storage_folder in self.folders:
@@ -486,6 +516,8 @@ class StorageFile(StorageObject, BufferedIOWrapper, BufferedIOBase):
 
     Base on the scheme of the URI, StorageFile uses an sub-class of StorageIOBase as the underlying raw IO
     For binary mode, the raw IO is wrapped by BufferedIO
+        The buffer size is BUFFER_SIZE (1MB) for cloud storage, or the block size for local files.
+        Use buffering=0 only when the caller already reads/writes in large chunks.
     For text mode, the bufferedIO is wrapped by TextIO
 
     Although StorageFile has raw_io as attribute, most operations should be done with the buffered_io
@@ -526,6 +558,7 @@ class StorageFile(StorageObject, BufferedIOWrapper, BufferedIOBase):
         StorageObject.__init__(self, uri)
         # Mode will be set by open()
         self._mode = None
+        self._mode_key = 0
         # The raw_io here is initialized but not opened.
         # The raw_io and buffered_io will be opened in __init_io()
         self.raw_io = self.__init_raw_io()
@@ -667,7 +700,7 @@ class StorageFile(StorageObject, BufferedIOWrapper, BufferedIOBase):
         if not self.mode:
             return False
         if mode:
-            return sorted(self.mode) == sorted(mode)
+            return self._mode_key == get_mode_key(mode)
         return True
 
     def open(self, mode='r', buffering=-1, encoding=None, errors=None, newline=None, closefd=True, opener=None):
@@ -691,6 +724,7 @@ class StorageFile(StorageObject, BufferedIOWrapper, BufferedIOBase):
         """
         # Stores the arguments as protected attributes
         self._mode = str(mode)
+        self._mode_key = get_mode_key(self._mode)
         # logger.debug("Opening %s ..." % self.uri)
         # The raw_io will be initialized in __init_io()
         if not self.raw_io.closed:
@@ -872,6 +906,7 @@ class StorageFile(StorageObject, BufferedIOWrapper, BufferedIOBase):
         # Copy the stream
         with self.open("rb") as f:
             self.copy_stream(f, to_file_obj)
+        to_file_obj.flush()
         return to_file_obj
 
     def upload(self, from_file_obj):
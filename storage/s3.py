@@ -1,5 +1,6 @@
 import logging
 import boto3
+from io import BytesIO
 from botocore.exceptions import ClientError
 from .base import StorageFolderBase
 from .cloud import BucketStorageObject, CloudStoragePrefix, CloudStorageIO
@@ -25,7 +26,9 @@ class S3Object(BucketStorageObject):
         Use blob.exists() to determine whether or not the blob exists.
 
         """
-        s3 = boto3.resource('s3')
+        # boto3 sessions are not thread safe, files may be copied in multiple threads.
+        with self.client_lock:
+            s3 = boto3.resource('s3')
         # logger.debug("Getting blob: %s" % self.uri)
         return s3.Object(self.bucket_name, self.prefix)
 
@@ -141,6 +144,101 @@ class S3Folder(S3Prefix, StorageFolderBase):
         ]
 
 
+class S3MultipartWriter:
+    """Streams data to an S3 object using multipart upload.
+
+    Data is buffered in memory and uploaded as a part once the buffer reaches the current part size.
+    Data smaller than one part is uploaded with a single put_object request when the writer is closed.
+
+    S3 allows at most 10,000 parts in an upload.
+    The part size starts at part_size and doubles after every PARTS_PER_SIZE parts,
+    so that the size of the upload is not limited by the number of parts.
+    Starting from 8MB, 10,000 parts can hold more than the 5TB maximum size of an S3 object.
+
+    See Also:
+        https://docs.aws.amazon.com/AmazonS3/latest/dev/mpuoverview.html
+        https://docs.aws.amazon.com/AmazonS3/latest/dev/qfacts.html
+    """
+    # The number of parts uploaded before the part size is doubled.
+    PARTS_PER_SIZE = 1000
+    # The maximum size of a part allowed by S3.
+    MAX_PART_SIZE = 5 * 1024 * 1024 * 1024
+
+    def __init__(self, client, bucket_name, key, part_size):
+        self.client = client
+        self.bucket_name = bucket_name
+        self.key = key
+        self.part_size = part_size
+        self.upload_id = None
+        self.parts = []
+        # Indicates whether the upload is aborted due to an error.
+        # Data will not be uploaded once the upload is aborted.
+        self.aborted = False
+        self.__buffer = BytesIO()
+
+    @property
+    def current_part_size(self):
+        """The size of the next part to be uploaded.
+        """
+        part_size = self.part_size * 2 ** (len(self.parts) // self.PARTS_PER_SIZE)
+        return min(part_size, self.MAX_PART_SIZE)
+
+    def write(self, b):
+        if self.aborted:
+            raise IOError("Upload to s3://%s/%s is aborted." % (self.bucket_name, self.key))
+        size = self.__buffer.write(b)
+        if self.__buffer.tell() >= self.current_part_size:
+            self.__upload_part()
+        return size
+
+    def __upload_part(self):
+        try:
+            if self.upload_id is None:
+                response = self.client.create_multipart_upload(Bucket=self.bucket_name, Key=self.key)
+                self.upload_id = response["UploadId"]
+            part_number = len(self.parts) + 1
+            response = self.client.upload_part(
+                Bucket=self.bucket_name, Key=self.key, UploadId=self.upload_id,
+                PartNumber=part_number, Body=self.__buffer.getvalue()
+            )
+        except Exception:
+            self.abort()
+            raise
+        self.parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+        self.__buffer = BytesIO()
+
+    def abort(self):
+        """Aborts the multipart upload, if any, so that the uploaded parts will not be kept in the bucket.
+        No data will be uploaded by the writer after calling this method.
+        """
+        self.aborted = True
+        self.__buffer = BytesIO()
+        if self.upload_id is not None:
+            logger.debug("Aborting multipart upload to s3://%s/%s" % (self.bucket_name, self.key))
+            self.client.abort_multipart_upload(Bucket=self.bucket_name, Key=self.key, UploadId=self.upload_id)
+            self.upload_id = None
+
+    def close(self):
+        if self.aborted:
+            # Do not overwrite the object with partial data.
+            logger.warning("Upload to s3://%s/%s was aborted, no data is uploaded." % (self.bucket_name, self.key))
+            return
+        if self.upload_id is None:
+            self.client.put_object(Bucket=self.bucket_name, Key=self.key, Body=self.__buffer.getvalue())
+            return
+        if self.__buffer.tell():
+            self.__upload_part()
+        try:
+            self.client.complete_multipart_upload(
+                Bucket=self.bucket_name, Key=self.key, UploadId=self.upload_id,
+                MultipartUpload={"Parts": self.parts}
+            )
+        except Exception:
+            self.abort()
+            raise
+        self.upload_id = None
+
+
 class S3File(S3Object,CloudStorageIO):
     def __init__(self, uri):
         # file_io will be initialized by open()
@@ -164,9 +262,23 @@ class S3File(S3Object,CloudStorageIO):
     def get_size(self):
         return self.blob.content_length
 
+    def _fetch_metadata(self):
+        """Gets the existence and size of the object with a single HEAD request.
+        """
+        try:
+            response = self.client.head_object(Bucket=self.bucket_name, Key=self.prefix)
+        except ClientError as e:
+            if e.response['Error']['Code'] == '404':
+                return False, None
+            raise e
+        return True, response.get("ContentLength")
+
     def upload(self, from_file_obj):
         self.blob.upload_fileobj(from_file_obj)
 
+    def open_writer(self):
+        return S3MultipartWriter(self.client, self.bucket_name, self.prefix, self.PART_SIZE)
+
     def download(self, to_file_obj):
         self.blob.download_fileobj(to_file_obj)
         return to_file_obj
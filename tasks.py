@@ -1,11 +1,17 @@
 """Contains classes for running functions/commands asynchronously.
 """
+import asyncio
 import logging
 import pstats
+import queue
+import random
+import shlex
 import subprocess
+import sys
 import threading
 import time
 import traceback
+from concurrent.futures import Future
 from cProfile import Profile
 # try:
 from .outputs import CaptureOutput
@@ -20,11 +26,75 @@ from .outputs import CaptureOutput
 logger = logging.getLogger(__name__)
 
 
+class DaemonThreadPool:
+    """Represents a pool of daemon threads for running functions asynchronously.
+
+    Idle threads are reused to run new functions.
+    A new thread is started when there is no idle thread, i.e. the number of threads is not limited.
+    Therefore, a function in the pool can wait for another function in the pool without blocking the pool.
+    Since the threads are daemon threads, the program does not wait for the running functions before exiting.
+
+    Threads idle for more than IDLE_TIMEOUT seconds are terminated.
+    """
+    # The number of seconds an idle thread waits for a new function before terminating.
+    IDLE_TIMEOUT = 60
+
+    def __init__(self, thread_name_prefix="pool"):
+        self.thread_name_prefix = thread_name_prefix
+        self.__queue = queue.Queue()
+        # The number of idle threads minus the number of functions waiting in the queue.
+        self.__idle = 0
+        self.__count = 0
+        # Must use lock when putting functions into the queue or changing the counts.
+        self.__lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):
+        """Schedules fn(*args, **kwargs) to run in a thread of the pool.
+
+        Returns: A concurrent.futures.Future representing the execution of the function.
+        """
+        future = Future()
+        with self.__lock:
+            self.__queue.put((future, fn, args, kwargs))
+            if self.__idle > 0:
+                self.__idle -= 1
+                return future
+            self.__count += 1
+            name = "%s_%s" % (self.thread_name_prefix, self.__count)
+        threading.Thread(target=self.__work, name=name, daemon=True).start()
+        return future
+
+    def __work(self):
+        """Runs the functions in the queue until the thread is idle for IDLE_TIMEOUT seconds.
+        """
+        while True:
+            try:
+                future, fn, args, kwargs = self.__queue.get(timeout=self.IDLE_TIMEOUT)
+            except queue.Empty:
+                with self.__lock:
+                    # A function may be submitted right after the timeout.
+                    if not self.__queue.empty():
+                        continue
+                    self.__idle -= 1
+                    return
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as ex:
+                    future.set_exception(ex)
+                else:
+                    future.set_result(result)
+            # Release the references before waiting for the next function.
+            future = fn = args = kwargs = None
+            with self.__lock:
+                self.__idle += 1
+
+
 class Task:
     """A base class for representing a task like running a function or a command.
 
     Attributes:
-        thread: The thread running the task, if the the task is running asynchronous.
+        thread: The Future of the task, if the the task is running asynchronous.
             The thread value is set by run_async().
         The following attributes are designed to capture the output of running the task.
         std_out (str): Captured standard outputs.
@@ -38,6 +108,12 @@ class Task:
     The subclass should implement the run() method.
     The run() method should handle the capturing of outputs.
     """
+    # Thread pool shared by all tasks running asynchronously.
+    # The pool uses daemon threads without size limit, so that:
+    #   a task can run_async() and join() another task without deadlock, and
+    #   the program does not wait for unfinished tasks before exiting.
+    executor = DaemonThreadPool(thread_name_prefix="aries-task")
+
     def __init__(self):
         self.pid = None
         self.thread = None
@@ -47,28 +123,36 @@ class Task:
         self.std_err = ""
         self.log_out = ""
         self.exc_out = ""
+        # Caches the log_list and the log_out from which the log_list is generated.
+        self.__log_list = None
+        self.__log_list_source = None
 
     @property
     def log_list(self):
         """Log messages as a list.
+        The list is cached until log_out is changed.
         """
-        return self.log_out.strip("\n").split("\n")
+        log_out = self.log_out
+        if self.__log_list is None or self.__log_list_source is not log_out:
+            self.__log_list = log_out.strip("\n").split("\n")
+            self.__log_list_source = log_out
+        return self.__log_list
 
     def print_outputs(self):
         """Prints the PID, return value, stdout, stderr and logs.
         """
-        print("=" * 80)
-        print("PID: %s" % self.pid)
-        print("RETURNS: %s" % self.returns)
-        print("STD OUT:")
-        for line in self.std_out.split("\n"):
-            print(line)
-        print("STD ERR:")
-        for line in self.std_err.split("\n"):
-            print(line)
-        print("LOGS:")
-        for line in self.log_out.split("\n"):
-            print(line)
+        # Write the outputs with a single call.
+        sys.stdout.write("\n".join([
+            "=" * 80,
+            "PID: %s" % self.pid,
+            "RETURNS: %s" % self.returns,
+            "STD OUT:",
+            self.std_out,
+            "STD ERR:",
+            self.std_err,
+            "LOGS:",
+            self.log_out,
+        ]) + "\n")
 
     def run(self):
         """Runs the task and capture the outputs.
@@ -79,25 +163,22 @@ class Task:
         )
 
     def run_async(self):
-        """Runs the task asynchronous by calling the run() method in a daemon thread.
+        """Runs the task asynchronous by calling the run() method in the shared thread pool.
 
-        Returns: The daemon thread running the task.
+        Returns: A Future representing the execution of the task.
         """
-        thread = threading.Thread(
-            target=self.run,
-        )
-        thread.daemon = True
-        thread.start()
-        self.thread = thread
+        self.thread = self.executor.submit(self.run)
         return self.thread
 
     def join(self):
-        """Blocks the calling thread until the daemon thread running the task terminates.
+        """Blocks the calling thread until the task running asynchronous finishes.
+
+        Returns: The value returned by run(), or None if the task is not running asynchronous.
+            Exception raised by run() will be re-raised.
         """
-        if self.thread and self.thread.isAlive():
-            return self.thread.join()
-        else:
+        if self.thread is None:
             return None
+        return self.thread.result()
 
 
 class FunctionTask(Task):
@@ -107,7 +188,7 @@ class FunctionTask(Task):
     The logging will be captured by identifying the thread ID of the thread running the function.
 
     Attributes:
-        thread: The thread running the function, if the the function is running asynchronous.
+        thread: The Future of the function, if the the function is running asynchronous.
             The thread value is set by run_async().
         The following attributes are designed to capture the output of running the function.
         std_out (str): Captured standard outputs.
@@ -122,18 +203,11 @@ class FunctionTask(Task):
         kwargs: The keyword arguments for executing the function.
 
     Remarks:
-        std_out and std_err will contain the outputs from all threads running in the same process.
+        std_out and std_err contain only the outputs from the thread running the function.
+        Outputs from threads started by the function are not captured,
+        they are written to the original stdout/stderr.
 
     """
-    # Stores a list of attribute names to be captured from the process running the function
-    __output_attributes = [
-        "std_out",
-        "std_err",
-        "log_out",
-        "exc_out",
-        "returns",
-    ]
-
     def __init__(self, func, *args, **kwargs):
         """Initializes a task to run a function.
 
@@ -155,29 +229,10 @@ class FunctionTask(Task):
         self.log_filters.append(log_filter)
         return self
 
-    def __unpack_outputs(self, out):
-        """Sets a list of attributes (self.__output_attributes) by copying values from a dictionary.
-
-        Args:
-            out (dict): The dictionary containing the values for attributes.
-                The keys in the dictionary must be the same as the attribute names.
-
-        """
-        for k in self.__output_attributes:
-            setattr(self, k, out.get(k))
-
-    def __pack_outputs(self, out):
-        """Saves a list of attributes (self.__output_attributes) to a dictionary.
-
-        Args:
-            out: An object with all attributes listed in self.__output_attributes.
-
-        """
-        return {
-            k: getattr(out, k) for k in self.__output_attributes
-        }
-
     def __run(self):
+        """Runs the function and copies the captured outputs to the attributes of this task.
+        """
+        out = None
         try:
             with CaptureOutput(filters=self.log_filters) as out:
                 self.out = out
@@ -192,15 +247,20 @@ class FunctionTask(Task):
             # Reset self.exception if the run is successful.
             # This is for run_and_retry()
             self.exception = None
-        try:
-            # name = self.func.__name__ if hasattr(self.func, "__name__") else str(self.func)
-            # logger.debug("Finished running %s()..." % name)
-            return self.__pack_outputs(out)
-        except Exception as ex:
+        if out is None:
+            # The outputs are not captured if CaptureOutput failed to start.
+            ex = self.exception
             print(ex)
-            return {
-                "exc_out": traceback.format_exc()
-            }
+            self.std_out = self.std_err = self.log_out = self.returns = None
+            self.exc_out = "".join(traceback.format_exception(type(ex), ex, ex.__traceback__))
+            return
+        # name = self.func.__name__ if hasattr(self.func, "__name__") else str(self.func)
+        # logger.debug("Finished running %s()..." % name)
+        self.std_out = out.std_out
+        self.std_err = out.std_err
+        self.log_out = out.log_out
+        self.exc_out = out.exc_out
+        self.returns = out.returns
 
     def exit_run(self):
         """Additional processing before exiting the task.
@@ -212,16 +272,7 @@ class FunctionTask(Task):
     def run(self, suppress_exception=True):
         """Runs the function and captures the outputs.
         """
-        # receiver, pipe = Pipe()
-        # p = Process(target=self.__run, args=(pipe,))
-        # p.start()
-        #
-        # self.pid = p.pid
-        # print("%s PROCESS STARTED" % p.pid)
-        # out = receiver.recv()
-        # print("%s MESSAGE RECEIVED" % p.pid)
-        # p.terminate()
-        self.__unpack_outputs(self.__run())
+        self.__run()
         if self.exc_out:
             print(self.exc_out)
         self.exit_run()
@@ -240,10 +291,12 @@ class FunctionTask(Task):
         stats.sort_stats('cumulative', 'time').print_stats(0.1)
 
     def run_and_retry(self, max_retry=10, exceptions=Exception, 
-                      base_interval=2, retry_pattern='exponential', capture_output='True'):
+                      base_interval=2, retry_pattern='exponential', capture_output='True', max_interval=300):
         """Runs the function and retry a few times if certain exceptions occurs.
         The time interval between the ith and (i+1)th retry is base_interval**i, 
             i.e. interval increases exponentially.
+        The interval is capped at max_interval and randomized by +/-20%,
+            so that tasks failing at the same time will not retry at the same time.
 
         Args:
             max_retry (int): The number of times to re-try.
@@ -257,6 +310,7 @@ class FunctionTask(Task):
             capture_output: Indicate if the outputs and logs of the function should be captured.
                 Outputs and logs will be captured to std_out, std_err and log_out attributes.
                 Setting capture_output to False will improve the performance.
+            max_interval (int): The maximum interval between two retries in seconds, before randomization.
 
         Returns: The return value of the function.
 
@@ -272,9 +326,10 @@ class FunctionTask(Task):
                 error = ex
                 traceback.print_exc()
                 if retry_pattern == "exponential":
-                    time.sleep(base_interval ** (i + 1))
+                    interval = base_interval ** (i + 1)
                 else:
-                    time.sleep(base_interval * (i + 1))
+                    interval = base_interval * (i + 1)
+                time.sleep(min(interval, max_interval) * random.uniform(0.8, 1.2))
             else:
                 return results
         # The following will be executed only if for loop finishes without break/return
@@ -286,7 +341,7 @@ class ShellCommand(Task):
     """Represents a task of running a shell command.
 
     Attributes:
-        thread: The thread running the task, if the the task is running asynchronous.
+        thread: The Future of the task, if the the task is running asynchronous.
             The thread value is set by run_async().
         The following attributes are designed to capture the output of running the task.
         std_out (str): Captured standard outputs.
@@ -339,3 +394,66 @@ class ShellCommand(Task):
         self.std_err = err.decode()
         self.returns = self.process.returncode
         return self
+
+    async def __run_exec(self):
+        """Runs the command as a subprocess of the event loop, without a shell.
+        """
+        try:
+            self.process = await asyncio.create_subprocess_exec(
+                *shlex.split(self.cmd),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except (OSError, ValueError) as ex:
+            # e.g. The program is not found (OSError) or the command has unmatched quotes (ValueError).
+            self.exception = ex
+            self.exc_out = traceback.format_exc()
+            return self
+        self.pid = self.process.pid
+        out, err = await self.process.communicate()
+        self.std_out = out.decode()
+        self.std_err = err.decode()
+        self.returns = self.process.returncode
+        return self
+
+    @staticmethod
+    def run_many(cmds):
+        """Runs multiple commands concurrently using asyncio subprocesses in the calling thread.
+
+        Unlike run(), the commands are split by shlex and executed directly without a shell.
+        Shell features like pipes, redirections and environment variable expansion are not supported.
+        Use run() or run_async() for commands requiring a shell.
+        In Python 3.7 or earlier, this method must be called from the main thread,
+            in which the event loop is temporarily set as the current event loop of the thread.
+
+        Args:
+            cmds (list): A list of commands, each as a string.
+
+        Returns: A list of ShellCommand objects with the outputs of the commands, in the same order as cmds.
+            If a command cannot be started, the exception will be saved in the exception attribute.
+
+        """
+        tasks = [ShellCommand(cmd) for cmd in cmds]
+
+        async def run_tasks():
+            return await asyncio.gather(*[task.__run_exec() for task in tasks])
+
+        loop = asyncio.new_event_loop()
+        # Before Python 3.8, the child watcher must be attached to the loop running the subprocesses.
+        attach_watcher = sys.version_info < (3, 8) and sys.platform != "win32"
+        previous_loop = None
+        if attach_watcher:
+            try:
+                previous_loop = asyncio.get_event_loop()
+            except RuntimeError:
+                previous_loop = None
+            asyncio.set_event_loop(loop)
+            asyncio.get_child_watcher().attach_loop(loop)
+        try:
+            loop.run_until_complete(run_tasks())
+        finally:
+            if attach_watcher:
+                asyncio.set_event_loop(previous_loop)
+                asyncio.get_child_watcher().attach_loop(previous_loop)
+            loop.close()
+        return tasks
@@ -4,7 +4,6 @@ import logging
 import time
 import os
 import sys
-from collections import OrderedDict
 from unittest import TestCase
 from .outputs import StreamHandler, PackageLogFilter
 
@@ -30,18 +29,20 @@ class AriesTest(TestCase):
     # Stores the time for each test.
     # key: name of the test method.
     # value: time elapsed during the test.
-    times = OrderedDict()
+    times = dict()
 
     # Override logger_names in subclasses to avoid enabling debug logging for root logger.
     logger_names = [""]
 
     decorated = False
 
+    # The stream handler attached to the loggers while running each test of the class.
+    stream_handler = None
+
     @classmethod
     def __decorate_test_case(cls, func):
         """A decorator for test case.
-        1. Adds additional logging handler to test case so that logging will be streamed to stdout.
-        2. Set logger level to DEBUG
+        Sends the logging of the stream handler to the sys.stdout used by the test case.
 
         Args:
             func: test case function.
@@ -50,39 +51,45 @@ class AriesTest(TestCase):
 
         """
         def test_case_with_logging(*args, **kwargs):
-            """Wraps the test cases and add a stream handler for logging
+            """Wraps the test cases, attaches the stream handler to the loggers,
+            and removes the handler when the test case finishes.
             """
+            stream_handler = cls.stream_handler
+            if stream_handler is None:
+                return func(*args, **kwargs)
             # At this point, unittest already replaced the sys.stdout
-            # The sys.stdout passing into the StreamHandler is NOT the original system standard output
-            # The default value (sys.stdout) for StreamHanlder() will send the logs to the system standard output
-            stream_handler = StreamHandler(sys.stdout)
-            package_filter = PackageLogFilter(packages=[os.path.basename(os.path.abspath(os.curdir))])
-            stream_handler.addFilter(package_filter)
-            loggers = dict()
+            # The sys.stdout here is NOT the original system standard output
+            stream_handler.stream = sys.stdout
+            logger_levels = dict()
             for name in cls.logger_names:
                 logger = logging.getLogger(name)
-                level = logger.getEffectiveLevel()
-                loggers[logger] = level
+                logger_levels[logger] = logger.level
                 logger.setLevel(logging.DEBUG)
                 logger.addHandler(stream_handler)
             try:
-                # Run the function(test)
-                results = func(*args, **kwargs)
+                return func(*args, **kwargs)
             finally:
-                for logger, level in loggers.items():
+                for logger, level in logger_levels.items():
                     logger.removeHandler(stream_handler)
                     logger.setLevel(level)
-            return results
 
         return test_case_with_logging
 
     @classmethod
     def setUpClass(cls):
         """Setup the test class.
-        Each test case will be decorated so that the logger outputs are streamed to stdout.
+        A stream handler is created once for the test class.
+        Each test case will be decorated so that the handler is attached to the loggers,
+            the logger levels are set to DEBUG, and the logger outputs are streamed to stdout.
+        The handler is removed and the logger levels are restored when each test case finishes.
 
         """
         super().setUpClass()
+        stream_handler = StreamHandler(sys.stdout)
+        package_filter = PackageLogFilter(packages=[os.path.basename(os.path.abspath(os.curdir))])
+        stream_handler.addFilter(package_filter)
+        cls.stream_handler = stream_handler
+
         if not cls.decorated:
             # Find all test cases
             attrs = dir(cls)
@@ -112,10 +119,8 @@ class AriesTest(TestCase):
         if result is None:
             result = self.defaultTestResult()
         result.buffer = True
-        start = time.time()
+        start = time.perf_counter()
         returns = super().run(result)
-        end = time.time()
-        elapsed = end - start
-        self.times[self._testMethodName] = elapsed
+        self.times[self._testMethodName] = time.perf_counter() - start
         return returns
 
@@ -1,6 +1,7 @@
 import os
 import sys
 import logging
+import threading
 from unittest import TestCase
 aries_parent = os.path.join(os.path.dirname(__file__), "..", "..")
 if aries_parent not in sys.path:
@@ -39,6 +40,65 @@ class TestLogging(AriesTest):
         self.assertTrue(out.logs[0].endswith("Test Info"), out.logs[0])
         self.assertEqual(out.std_out, "Test Print\n")
 
+    def test_capturing_logs_at_log_time(self):
+        """Tests that the captured logs show the values at the time of logging.
+        """
+        logger = logging.getLogger(__name__)
+        state = dict(step=1)
+        with CaptureOutput() as out:
+            logger.debug("state=%s", state)
+            logger.debug(state)
+            state["step"] = 2
+        self.assertTrue(out.logs[0].endswith("state={'step': 1}"), out.logs[0])
+        self.assertIn('"step": 1', out.logs[1])
+
+    def test_capturing_logs_without_side_effects(self):
+        """Tests that capturing logs does not modify the log records or raise exceptions.
+        """
+        records = []
+
+        class RecordHandler(logging.Handler):
+            def emit(self, record):
+                records.append((record.msg, record.args))
+
+        logger = logging.getLogger(__name__)
+        root_logger = logging.getLogger()
+        with CaptureOutput() as out:
+            handler = RecordHandler()
+            root_logger.addHandler(handler)
+            try:
+                logger.debug("value=%s", 1)
+                # Logging should not raise an exception even if the arguments are invalid.
+                logger.debug("value %d", "x")
+            finally:
+                root_logger.removeHandler(handler)
+        # Other handlers receive the original message and arguments.
+        self.assertEqual(records[0], ("value=%s", (1,)))
+        self.assertTrue(out.logs[0].endswith("value=1"), out.logs[0])
+        self.assertEqual(len(out.logs), 1, out.logs)
+
+    def test_capturing_outputs_in_threads(self):
+        """Tests capturing outputs of different threads independently.
+        """
+        def print_messages(name, outputs):
+            with CaptureOutput() as thread_out:
+                for i in range(20):
+                    print("%s %s" % (name, i))
+            outputs[name] = thread_out.std_out
+
+        outputs = dict()
+        with CaptureOutput() as out:
+            print("Main Thread")
+            threads = [threading.Thread(target=print_messages, args=("T%s" % i, outputs)) for i in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        # Outputs from other threads should not be captured by the main thread.
+        self.assertEqual(out.std_out, "Main Thread\n")
+        for name, std_out in outputs.items():
+            self.assertEqual(std_out, "".join(["%s %s\n" % (name, i) for i in range(20)]))
+
 
 class TestConfigLogging(TestCase):
     """Tests here only checks whether the program executed without error.
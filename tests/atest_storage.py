@@ -13,6 +13,7 @@ try:
     from ..test import AriesTest
     from ..storage import StoragePrefix, StorageFolder, StorageFile
     from ..storage import gs
+    from ..storage.io import copy_files
 except:
     aries_parent = os.path.join(os.path.dirname(__file__), "..", "..")
     if aries_parent not in sys.path:
@@ -20,6 +21,7 @@ except:
     from Aries.storage import gs
     from Aries.test import AriesTest
     from Aries.storage import StoragePrefix, StorageFile, StorageFolder
+    from Aries.storage.io import copy_files
 
 
 class TempFolder:
@@ -101,6 +103,11 @@ class TestStorage(AriesTest):
         self.assertGreater(len(self.test_folder.get_folder_attributes()), 1)
         # File attributes
         self.assertIn("file_in_test_folder", self.test_folder.get_file_attributes("name"))
+        # Multiple attributes
+        self.assertIn(
+            ("file_in_test_folder", self.SCHEME),
+            self.test_folder.get_file_attributes(("name", "scheme"))
+        )
 
     def test_get_folder_names(self):
         folder = StorageFolder(self.TEST_ROOT)
@@ -223,6 +230,19 @@ class TestStorage(AriesTest):
             self.assertIn(os.path.join(dst_folder_uri, "empty_file"), file_paths)
             self.assertIn(os.path.join(dst_folder_uri, "abc.txt"), file_paths)
 
+    def test_copy_files_concurrently(self):
+        """Tests copying files concurrently into new nested folders.
+        """
+        src_files = [StorageFile(os.path.join(self.TEST_ROOT, "test_folder_0", "abc.txt"))] * 16
+        dst_parent = os.path.join(self.TEST_ROOT, "new_folder")
+        with TempFolder(dst_parent):
+            for i in range(5):
+                dst_folder_uri = os.path.join(dst_parent, "copy_%s" % i, "nested")
+                destinations = [os.path.join(dst_folder_uri, "abc_%s.txt" % j) for j in range(len(src_files))]
+                copy_files(src_files, destinations)
+                for destination in destinations:
+                    self.assertEqual(StorageFile(destination).read(), b"abc\ncba\n")
+
     def test_create_copy_and_delete_file(self):
         new_folder_uri = os.path.join(self.TEST_ROOT, "new_folder")
         with TempFolder(new_folder_uri) as folder:
@@ -0,0 +1,95 @@
+"""Contains tests for the CloudStorageIO class with an in-memory storage.
+These tests do not require access to any cloud storage.
+"""
+import logging
+import os
+import sys
+import time
+try:
+    from ..test import AriesTest
+    from ..storage.cloud import CloudStorageIO
+except:
+    aries_parent = os.path.join(os.path.dirname(__file__), "..", "..")
+    if aries_parent not in sys.path:
+        sys.path.append(aries_parent)
+    from Aries.test import AriesTest
+    from Aries.storage.cloud import CloudStorageIO
+logger = logging.getLogger(__name__)
+
+
+class MemoryFile(CloudStorageIO):
+    """Represents a file stored in a dictionary in place of a cloud storage.
+    """
+    # key: URI of the file, value: bytes.
+    objects = dict()
+
+    def __init__(self, uri):
+        CloudStorageIO.__init__(self, uri)
+        # Stores the (start, end) of the ranges requested by read_bytes().
+        self.ranges = []
+
+    def exists(self):
+        return self.uri in self.objects
+
+    def get_size(self):
+        return len(self.objects[self.uri])
+
+    def delete(self):
+        self.objects.pop(self.uri, None)
+
+    def upload(self, from_file_obj):
+        self.objects[self.uri] = from_file_obj.read()
+
+    def download(self, to_file_obj):
+        to_file_obj.write(self.objects[self.uri])
+        return to_file_obj
+
+    def read_bytes(self, start, end):
+        self.ranges.append((start, end))
+        return self.objects[self.uri][start:end + 1]
+
+
+class DelayedPartsFile(MemoryFile):
+    """Reads the byte ranges in parts, the parts at the beginning of the file are received last.
+    """
+    PART_SIZE = 4
+    PARALLEL_READ_THRESHOLD = 8
+
+    def read_bytes(self, start, end):
+        time.sleep(0.01 * (8 - start // self.PART_SIZE))
+        return super().read_bytes(start, end)
+
+
+class TestCloudStorageIO(AriesTest):
+    uri = "mem://bucket/file.txt"
+
+    def tearDown(self):
+        MemoryFile.objects.clear()
+
+    def test_append_after_seek(self):
+        """Tests that data is always written to the end of the file in appending modes.
+        """
+        MemoryFile.objects[self.uri] = b"HELLO"
+        with MemoryFile(self.uri).open("a+b") as f:
+            f.seek(0)
+            f.write(b"zz")
+        self.assertEqual(MemoryFile.objects[self.uri], b"HELLOzz")
+
+        with MemoryFile(self.uri).open("ab") as f:
+            f.write(b"123")
+            f.seek(0)
+            f.write(b"45")
+            self.assertEqual(f.tell(), 12)
+        self.assertEqual(MemoryFile.objects[self.uri], b"HELLOzz12345")
+
+    def test_read_parts(self):
+        """Tests reading a large range in parts concurrently.
+        """
+        data = b"".join([bytes([65 + i % 26]) for i in range(30)])
+        MemoryFile.objects[self.uri] = data
+        f = DelayedPartsFile(self.uri).open("rb")
+        f.seek(1)
+        self.assertEqual(f.read(), data[1:])
+        self.assertEqual(sorted(f.ranges), [(i, min(i + 3, 29)) for i in range(1, 30, 4)])
+        self.assertEqual(f.read_parts(2, 12), bytearray(data[2:13]))
+        f.close()
@@ -0,0 +1,137 @@
+"""Contains tests for streaming uploads to AWS S3 with a stub client.
+These tests do not require access to AWS.
+"""
+import logging
+import os
+import sys
+from io import UnsupportedOperation
+try:
+    from ..test import AriesTest
+    from ..storage.s3 import S3File, S3MultipartWriter
+except:
+    aries_parent = os.path.join(os.path.dirname(__file__), "..", "..")
+    if aries_parent not in sys.path:
+        sys.path.append(aries_parent)
+    from Aries.test import AriesTest
+    from Aries.storage.s3 import S3File, S3MultipartWriter
+logger = logging.getLogger(__name__)
+
+
+class StubS3Client:
+    """Records the requests of S3 upload methods in place of a boto3 S3 client.
+    """
+    def __init__(self, fail_on_part=None):
+        # The part number on which upload_part() raises an exception.
+        self.fail_on_part = fail_on_part
+        self.objects = dict()
+        self.parts = dict()
+        self.aborted = []
+        self.calls = []
+
+    def put_object(self, Bucket, Key, Body):
+        self.calls.append("put_object")
+        self.objects[(Bucket, Key)] = Body
+
+    def create_multipart_upload(self, Bucket, Key):
+        self.calls.append("create_multipart_upload")
+        return {"UploadId": "upload-id"}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.calls.append("upload_part")
+        if PartNumber == self.fail_on_part:
+            raise IOError("Failed to upload part %s" % PartNumber)
+        self.parts[PartNumber] = Body
+        return {"ETag": "etag-%s" % PartNumber}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self.calls.append("complete_multipart_upload")
+        parts = MultipartUpload["Parts"]
+        self.objects[(Bucket, Key)] = b"".join([self.parts[part["PartNumber"]] for part in parts])
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.calls.append("abort_multipart_upload")
+        self.aborted.append(UploadId)
+
+
+class TestS3MultipartWriter(AriesTest):
+    def test_put_object(self):
+        """Tests uploading data smaller than one part with a single request.
+        """
+        client = StubS3Client()
+        writer = S3MultipartWriter(client, "bucket", "key", 10)
+        writer.write(b"abc")
+        writer.write(b"def")
+        writer.close()
+        self.assertEqual(client.calls, ["put_object"])
+        self.assertEqual(client.objects[("bucket", "key")], b"abcdef")
+
+    def test_multipart_upload(self):
+        """Tests uploading data in multiple parts with increasing part size.
+        """
+        client = StubS3Client()
+        writer = S3MultipartWriter(client, "bucket", "key", 4)
+        writer.PARTS_PER_SIZE = 2
+        data = b"".join([bytes([65 + i % 26]) for i in range(50)])
+        for i in range(0, len(data), 2):
+            writer.write(data[i:i + 2])
+        writer.close()
+        self.assertEqual(client.calls[0], "create_multipart_upload")
+        self.assertEqual(client.calls[-1], "complete_multipart_upload")
+        self.assertEqual(client.objects[("bucket", "key")], data)
+        # The part size doubles after every 2 parts.
+        part_sizes = [len(client.parts[i]) for i in sorted(client.parts.keys())]
+        self.assertEqual(part_sizes, [4, 4, 8, 8, 16, 10])
+
+    def test_abort_multipart_upload(self):
+        """Tests aborting the multipart upload when a part fails to upload.
+        """
+        client = StubS3Client(fail_on_part=2)
+        writer = S3MultipartWriter(client, "bucket", "key", 4)
+        writer.write(b"abcd")
+        with self.assertRaises(IOError):
+            writer.write(b"efgh")
+        self.assertEqual(client.aborted, ["upload-id"])
+        self.assertIsNone(writer.upload_id)
+        self.assertNotIn(("bucket", "key"), client.objects)
+        # Closing the writer after the upload is aborted should not upload partial data.
+        writer.close()
+        self.assertNotIn("put_object", client.calls)
+        self.assertNotIn("complete_multipart_upload", client.calls)
+        self.assertNotIn(("bucket", "key"), client.objects)
+        with self.assertRaises(IOError):
+            writer.write(b"ijkl")
+
+    def test_abort_file_upload(self):
+        """Tests closing an S3 file after a part fails to upload, as in a with block.
+        """
+        client = StubS3Client(fail_on_part=2)
+        s3_file = S3File("s3://bucket/file.txt")
+        s3_file._client = client
+        with self.assertRaises(IOError):
+            with s3_file.open("wb") as f:
+                f.write(b"a" * S3File.PART_SIZE)
+                f.write(b"b" * S3File.PART_SIZE)
+        self.assertEqual(client.aborted, ["upload-id"])
+        self.assertNotIn(("bucket", "file.txt"), client.objects)
+
+
+class TestS3FileStreaming(AriesTest):
+    def test_write_only_mode(self):
+        """Tests streaming data to S3 when the file is opened in write-only mode.
+        """
+        client = StubS3Client()
+        s3_file = S3File("s3://bucket/folder/file.txt")
+        s3_file._client = client
+        s3_file.open("wb")
+        s3_file.write(b"Hello ")
+        s3_file.write(b"World")
+        self.assertEqual(s3_file.tell(), 11)
+        # Seeking to the current position is allowed.
+        self.assertEqual(s3_file.seek(0, 1), 11)
+        self.assertEqual(s3_file.seek(11), 11)
+        # Data streamed to the cloud cannot be re-written.
+        with self.assertRaises(UnsupportedOperation):
+            s3_file.seek(0)
+        s3_file.close()
+        self.assertEqual(client.calls, ["put_object"])
+        self.assertEqual(client.objects[("bucket", "folder/file.txt")], b"Hello World")
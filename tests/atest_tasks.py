@@ -21,6 +21,20 @@ class TestShellCommand(AriesTest):
         self.assertIn("..\n", cmd.std_out)
         self.assertIn(os.path.basename(__file__), cmd.std_out)
 
+    def test_run_many_commands(self):
+        cmds = tasks.ShellCommand.run_many([
+            "ls -a %s" % os.path.dirname(__file__),
+            "echo 'Hello World'",
+            "command_does_not_exist",
+            "echo 'unmatched quote",
+        ])
+        self.assertEqual(len(cmds), 4)
+        self.assertIn(os.path.basename(__file__), cmds[0].std_out)
+        self.assertEqual(cmds[0].returns, 0)
+        self.assertEqual(cmds[1].std_out, "Hello World\n")
+        self.assertIsInstance(cmds[2].exception, OSError)
+        self.assertIsInstance(cmds[3].exception, ValueError)
+
 
 class TestRunRetry(AriesTest):
     tries = 0
@@ -272,3 +286,21 @@ class TestFunctionTask(AriesTest):
         # Assert Exception
         self.assertIn("test1 Exception", t1.exc_out)
         self.assertIn("test2 Exception", t2.exc_out)
+
+    @staticmethod
+    def func_with_nested_task(name):
+        """Runs another task asynchronously and waits for it.
+        """
+        task = tasks.FunctionTask(time.sleep, 0.2)
+        task.run_async()
+        task.join()
+        return name
+
+    def test_run_nested_tasks(self):
+        """Tests running many tasks, each waiting for a nested task, without deadlock.
+        """
+        outer_tasks = [tasks.FunctionTask(self.func_with_nested_task, i) for i in range(40)]
+        futures = [task.run_async() for task in outer_tasks]
+        for i, future in enumerate(futures):
+            future.result(timeout=30)
+            self.assertEqual(outer_tasks[i].returns, i)
@@ -30,3 +30,32 @@ class TestWeb(AriesTest):
         url = "https://en.wikipedia.org/wiki/List_of_file_signatures"
         tables = web.HTML(url).get_tables()
         self.assertEqual(len(tables), 2, "There should be two tables in the HTML page.")
+
+    def test_append_query_string(self):
+        append_query_string = web.WebAPI.append_query_string
+        # No query string
+        self.assertEqual(append_query_string("https://example.com/api"), "https://example.com/api")
+        # Plain URL
+        self.assertEqual(
+            append_query_string("https://example.com/api", a=1),
+            "https://example.com/api?a=1"
+        )
+        # URL with existing query string
+        self.assertEqual(
+            append_query_string("https://example.com/api?a=1", b=2),
+            "https://example.com/api?a=1&b=2"
+        )
+        self.assertEqual(
+            append_query_string("https://example.com/api?", b=2),
+            "https://example.com/api?b=2"
+        )
+        # List values are encoded as multiple parameters with the same key.
+        self.assertEqual(
+            append_query_string("https://example.com/api", ids=[1, 2]),
+            "https://example.com/api?ids=1&ids=2"
+        )
+        # Special characters are URL-encoded.
+        self.assertEqual(
+            append_query_string("https://example.com/api", q="a b&c=d/é"),
+            "https://example.com/api?q=a+b%26c%3Dd%2F%C3%A9"
+        )
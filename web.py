@@ -1,10 +1,12 @@
 import requests
 import logging
 import contextlib
+import shutil
 from io import BytesIO
 from .storage import StorageObject
 from lxml import etree
 from urllib import request
+from urllib.parse import urlencode
 logger = logging.getLogger(__name__)
 
 
@@ -18,8 +20,17 @@ class WebAPI:
         base_url: The base URL for all API endpoint.
         If base_url is specified, relative URL can be used to make requests.
         Relative URL will be appended to base URL when making the requests.
+        session: A requests.Session, which keeps the connections alive and reuses them for all requests.
+            Call close() or use the context manager to close the connections.
+
+    Examples:
+        with WebAPI("https://api.weather.gov/") as api:
+            data = api.get_json("")
     
     """
+    # Prefixes of absolute URLs supported by WebAPI.
+    URL_PREFIXES = ("http://", "https://")
+
     def __init__(self, base_url="", **kwargs):
         """Initializes API.
 
@@ -29,9 +40,9 @@ class WebAPI:
         """
         self.kwargs = kwargs
         self.headers = {}
+        self.session = requests.Session()
 
-        base_url = base_url
-        if base_url.startswith("http://") or base_url.startswith("https://"):
+        if self.is_absolute_url(base_url):
             self.base_url = base_url
         else:
             raise ValueError("Base URL should start with http:// or https://")
@@ -64,11 +75,10 @@ class WebAPI:
         method = str(method).lower()
         if not hasattr(requests, method):
             raise ValueError("Invalid method: %s" % method)
-        request_func = getattr(requests, method)
         headers = kwargs.get("headers", {})
         headers.update(self.headers)
         kwargs["headers"] = headers
-        response = request_func(url, **kwargs)
+        response = self.session.request(method, url, **kwargs)
         return response
 
     def get(self, url, **kwargs):
@@ -84,7 +94,7 @@ class WebAPI:
         """
         url = self.build_url(url, **kwargs)
         logger.debug("Requesting data from %s" % url)
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url, headers=self.headers)
         logger.debug("Response code: %s" % response.status_code)
         if response.status_code != 200:
             logger.debug(response.content)
@@ -96,7 +106,7 @@ class WebAPI:
     def post(self, url, data, **kwargs):
         url = self.build_url(url, **kwargs)
         logger.debug("Posting data to %s" % url)
-        response = requests.post(url, json=data, headers=self.headers)
+        response = self.session.post(url, json=data, headers=self.headers)
         logger.debug("Response code: %s" % response.status_code)
         if response.status_code != 200:
             logger.debug(response.content)
@@ -108,7 +118,7 @@ class WebAPI:
     def delete(self, url, **kwargs):
         url = self.build_url(url, **kwargs)
         logger.debug("Deleting data from %s" % url)
-        response = requests.delete(url, headers=self.headers)
+        response = self.session.delete(url, headers=self.headers)
         return response
 
     def build_url(self, url, **kwargs):
@@ -123,18 +133,40 @@ class WebAPI:
         Returns:
             str: The absolute URL/Endpoint of the API with query string.
         """
-        url = url
-        if not (url.startswith("http://") or url.startswith("https://")):
+        if not self.is_absolute_url(url):
             url = "%s%s" % (self.base_url, url)
         query_dict = self.kwargs.copy()
         query_dict.update(kwargs)
         return self.append_query_string(url, **query_dict)
+
+    def close(self):
+        """Closes the connections in the session.
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
     
+    @staticmethod
+    def is_absolute_url(url):
+        """Determines if a URL starts with http:// or https://
+        Only the scheme is compared case-insensitively, the rest of the URL is not modified.
+        """
+        prefixes = WebAPI.URL_PREFIXES
+        # Most URLs have lower case scheme, which does not need the slicing and lower().
+        return url.startswith(prefixes) or url[:8].lower().startswith(prefixes)
+
     @staticmethod
     def append_query_string(url, **kwargs):
         """Appends query string to a URL
 
         Query string is specified as keyword arguments.
+        The keys and values are URL-encoded.
+        A list value will be encoded as multiple parameters with the same key.
         
         Args:
             url (str): URL
@@ -142,14 +174,14 @@ class WebAPI:
         Returns:
             str: URL with query string.
         """
-        for key, val in kwargs.items():
-            if "?" not in url:
-                url += "?"
-            if isinstance(val, list):
-                url += "".join(["&%s=%s" % (key, v) for v in val])
-            else:
-                url += "&%s=%s" % (key, val)
-        return url
+        query_string = urlencode(kwargs, doseq=True)
+        if not query_string:
+            return url
+        if "?" not in url:
+            return url + "?" + query_string
+        if url.endswith("?") or url.endswith("&"):
+            return url + query_string
+        return url + "&" + query_string
 
 
 class HTML:
@@ -234,9 +266,4 @@ def download(url, file_path):
     with open(file_path, 'wb') as out_file:
         with contextlib.closing(url_response) as fp:
             logger.debug("Downloading data from %s" % url)
-            block_size = 1 << 16
-            while True:
-                block = fp.read(block_size)
-                if not block:
-                    break
-                out_file.write(block)
+            shutil.copyfileobj(fp, out_file, 1 << 20)